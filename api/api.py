@@ -35,8 +35,8 @@ Key principles:
 
 from __future__ import annotations
 
+import asyncio
 import datetime as dt
-import json
 import logging
 import os
 import threading
@@ -44,16 +44,28 @@ import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-import pymysql
+import aiomysql
+import msgspec
+import numpy as np
+import orjson
+
+# Optional C-accelerated driver: asyncmy decodes the MySQL protocol in
+# Cython, several times faster than aiomysql's pure-Python parsing on
+# rowset-heavy endpoints. Picked up automatically when installed.
+try:
+    import asyncmy
+except ImportError:
+    asyncmy = None
 import yaml
-from dbutils.pooled_db import PooledDB
-from fastapi import Depends, FastAPI, HTTPException, Query, Request
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from slowapi import Limiter
 from slowapi.errors import RateLimitExceeded
 from slowapi.middleware import SlowAPIMiddleware
 from slowapi.util import get_remote_address
+from starlette.background import BackgroundTask
 
 # Prometheus
 from prometheus_fastapi_instrumentator import Instrumentator
@@ -112,23 +124,58 @@ def get_cfg() -> Dict[str, Any]:
 
 def ttl_cache(ttl_seconds: int):
     """
-    Simple TTL cache decorator.
+    Simple TTL cache decorator, keyed on positional arguments.
     Thread-safe.
     Suitable for caching file loads (hosts/services/targets_geo).
     """
     def deco(fn):
         lock = threading.Lock()
-        state = {"expires": 0.0, "value": None}
+        state: Dict[tuple, Tuple[float, Any]] = {}
+        inflight: Dict[tuple, threading.Event] = {}
 
-        def wrapped():
-            now = time.time()
+        def wrapped(*args, _force=False):
             with lock:
-                if now < state["expires"] and state["value"] is not None:
-                    return state["value"]
-                v = fn()
-                state["value"] = v
-                state["expires"] = now + ttl_seconds
-                return v
+                entry = state.get(args)
+                if not _force and entry is not None and time.time() < entry[0]:
+                    return entry[1]
+
+                # Single-flight: first thread past the freshness check
+                # recomputes, others wait on its event instead of piling
+                # onto fn() when the TTL expires under a burst.
+                event = inflight.get(args)
+                if event is None:
+                    event = threading.Event()
+                    inflight[args] = event
+                    is_leader = True
+                else:
+                    is_leader = False
+
+            if not is_leader:
+                event.wait(timeout=5.0)
+                with lock:
+                    entry = state.get(args)
+                    if entry is not None and time.time() < entry[0]:
+                        return entry[1]
+                # Leader failed (or timed out): recompute for ourselves.
+                return fn(*args)
+
+            try:
+                v = fn(*args)
+            except Exception:
+                with lock:
+                    inflight.pop(args, None)
+                event.set()
+                raise
+
+            with lock:
+                state[args] = (time.time() + ttl_seconds, v)
+                inflight.pop(args, None)
+            event.set()
+            return v
+
+        # Forced recompute, used by the startup refresher to swap in a
+        # fresh value before the TTL lapses.
+        wrapped.refresh = lambda *args: wrapped(*args, _force=True)
         return wrapped
     return deco
 
@@ -137,8 +184,7 @@ def ttl_cache(ttl_seconds: int):
 def load_hosts_cached() -> Dict[str, Dict[str, Any]]:
     if not HOSTS_PATH.exists():
         return {}
-    with HOSTS_PATH.open(encoding="utf-8") as fh:
-        hosts_list = json.load(fh)
+    hosts_list = orjson.loads(HOSTS_PATH.read_bytes())
     return {h["host_id"]: h for h in hosts_list if h.get("host_id")}
 
 
@@ -146,102 +192,134 @@ def load_hosts_cached() -> Dict[str, Dict[str, Any]]:
 def load_services_cached() -> List[Dict[str, Any]]:
     if not SERVICES_PATH.exists():
         return []
-    with SERVICES_PATH.open(encoding="utf-8") as fh:
-        return json.load(fh)
+    return orjson.loads(SERVICES_PATH.read_bytes())
 
 
 @ttl_cache(ttl_seconds=60)
 def load_targets_geo_cached() -> List[Dict[str, Any]]:
     if not TARGETS_GEO_PATH.exists():
         return []
-    with TARGETS_GEO_PATH.open(encoding="utf-8") as fh:
-        return json.load(fh)
+    return orjson.loads(TARGETS_GEO_PATH.read_bytes())
 
 
 # --------------------------------------------------------------------------- #
-# DB Pool (DBUtils)
+# DB Pool (aiomysql)
 # --------------------------------------------------------------------------- #
 
-DB_POOL: Optional[PooledDB] = None
+DB_POOL: Optional[Any] = None
+
+# Cursor classes resolved once for whichever driver is active.
+if asyncmy is not None:
+    DICT_CURSOR = asyncmy.cursors.DictCursor
+    SS_DICT_CURSOR = asyncmy.cursors.SSDictCursor
+else:
+    DICT_CURSOR = aiomysql.DictCursor
+    SS_DICT_CURSOR = aiomysql.SSDictCursor
 
+# Bounded wait on pool acquisition: fail fast (503) instead of queueing
+# requests indefinitely when the pool is exhausted.
+POOL_ACQUIRE_TIMEOUT = 5.0
 
-def init_db_pool() -> None:
+
+async def init_db_pool() -> None:
     """
-    Initialize DB connection pool at startup.
+    Initialize async DB connection pool at startup.
     Requirements:
-    - min 5-10 active cached connections
+    - min 5-10 idle connections
     - max 20 connections
     - handle dead connections
     """
-    global DB_POOL
+    global DB_POOL, POOL_ACQUIRE_TIMEOUT
     cfg = get_cfg()
     db_cfg = cfg.get("db") or {}
     if not isinstance(db_cfg, dict):
         raise RuntimeError("Missing 'db' section in config.yaml")
 
-    # Pool sizing
-    min_cached = int(db_cfg.get("pool_mincached", 5))
-    max_cached = int(db_cfg.get("pool_maxcached", 10))
-    max_conn = int(db_cfg.get("pool_maxconnections", 20))
+    # Pool sizing (sized at/above expected concurrency, not at 20)
+    min_size = int(db_cfg.get("pool_mincached", 5))
+    max_size = int(db_cfg.get("pool_maxconnections", 50))
+
+    POOL_ACQUIRE_TIMEOUT = float(db_cfg.get("pool_acquire_timeout", 5))
+
+    # Recycle a physical connection after this many idle seconds
+    # (the async-pool analog of DBUtils' maxusage/ping churn control).
+    pool_recycle = int(db_cfg.get("pool_recycle", 3600))
 
     # Timeouts (5s requested)
     connect_timeout = int(db_cfg.get("connect_timeout", 5))
-    read_timeout = int(db_cfg.get("read_timeout", 5))
-    write_timeout = int(db_cfg.get("write_timeout", 5))
 
     logger.info(
-        "Initializing DB pool mincached=%s maxcached=%s maxconnections=%s",
-        min_cached, max_cached, max_conn
+        "Initializing DB pool minsize=%s maxsize=%s",
+        min_size, max_size
     )
 
-    DB_POOL = PooledDB(
-        creator=pymysql,
-        mincached=min_cached,
-        maxcached=max_cached,
-        maxconnections=max_conn,
-        blocking=True,  # if pool exhausted, wait (better than random failures)
-        ping=1,         # check connection before using (auto-reconnect)
+    common = dict(
+        minsize=min_size,
+        maxsize=max_size,
         host=db_cfg["host"],
         port=int(db_cfg["port"]),
         user=db_cfg["user"],
         password=db_cfg["password"],
-        database=db_cfg["database"],
         autocommit=True,
         charset="utf8mb4",
-        cursorclass=pymysql.cursors.DictCursor,
         connect_timeout=connect_timeout,
-        read_timeout=read_timeout,
-        write_timeout=write_timeout,
+        pool_recycle=pool_recycle,  # recycle idle connections (avoid server-side kills)
+        # Session query timeout (5s), set once per physical connection
+        # instead of one extra round-trip per request (MySQL >= 5.7).
+        init_command="SET SESSION MAX_EXECUTION_TIME=5000",
     )
 
+    if asyncmy is not None:
+        logger.info("DB driver: asyncmy")
+        DB_POOL = await asyncmy.create_pool(
+            database=db_cfg["database"],
+            cursor_cls=DICT_CURSOR,
+            **common,
+        )
+    else:
+        logger.info("DB driver: aiomysql")
+        DB_POOL = await aiomysql.create_pool(
+            db=db_cfg["database"],
+            cursorclass=DICT_CURSOR,
+            **common,
+        )
+
 
-def get_db_conn():
+async def get_pool(request: Request) -> Any:
     """
-    FastAPI dependency: yields a pooled connection.
-    Uses MAX_EXECUTION_TIME session setting (5s) for SELECT queries (MySQL >= 5.7 / MariaDB may vary).
+    FastAPI dependency: returns the app-wide pool.
     """
-    if DB_POOL is None:
+    pool = getattr(request.app.state, "pool", None)
+    if pool is None:
         # if startup didn't run (edge case), try init
-        init_db_pool()
+        await init_db_pool()
+        request.app.state.pool = DB_POOL
+        pool = DB_POOL
+    return pool
+
+
+async def get_db_conn(pool: Any = Depends(get_pool)):
+    """
+    FastAPI dependency: yields a pooled connection.
 
-    assert DB_POOL is not None
-    conn = DB_POOL.connection()
+    This is the ONLY connection-yielding dependency: FastAPI's dependency
+    cache guarantees one connection per request even if several sub-deps
+    ask for it, so a single request can never hold two pool slots.
+    Helpers (fetch_last_by_service_ids, ...) always take the connection
+    explicitly instead of re-entering Depends.
+
+    The MAX_EXECUTION_TIME session setting is applied once per physical
+    connection via the pool's init_command, not here.
+    """
     try:
-        # Per-connection/session query timeout (best-effort).
-        # If not supported, it will fail silently.
-        try:
-            with conn.cursor() as cur:
-                cur.execute("SET SESSION MAX_EXECUTION_TIME=5000")
-        except Exception:
-            pass
+        conn = await asyncio.wait_for(pool.acquire(), timeout=POOL_ACQUIRE_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=503, detail="db pool exhausted")
 
+    try:
         yield conn
     finally:
-        # With DBUtils, close() returns connection to pool.
-        try:
-            conn.close()
-        except Exception:
-            pass
+        pool.release(conn)
 
 
 # --------------------------------------------------------------------------- #
@@ -286,24 +364,43 @@ class TargetGeo(BaseModel):
     latency_ms: int
 
 
+# msgspec Structs used for runtime row construction + encoding on the
+# meta endpoints (5-10x faster than Pydantic validation/serialization).
+# The Pydantic models above stay on the routes for the OpenAPI schema.
+
+class TargetMetaRow(msgspec.Struct):
+    id: str
+    type: str
+    host_id: Optional[str]
+    host_address: Optional[str]
+    enabled: bool = True
+
+
+class TargetGeoRow(msgspec.Struct):
+    id: str        # host_id
+    name: Optional[str]
+    lat: float
+    lng: float
+    status: int
+    latency_ms: int
+
+
 # --------------------------------------------------------------------------- #
 # Helpers
 # --------------------------------------------------------------------------- #
 
-def parse_meta_json(rows: List[Dict[str, Any]], field: str = "meta") -> List[Dict[str, Any]]:
+def wrap_raw_meta(rows: List[Dict[str, Any]], field: str = "meta") -> List[Dict[str, Any]]:
     """
-    Parses JSON meta field safely (prevents crashes on invalid json).
+    Passes the meta_json column through to the response as-is via
+    orjson.Fragment: the DB already stores valid JSON, so deserializing
+    and re-serializing every blob in Python is pure wasted CPU.
     """
     for r in rows:
         raw = r.get(field)
         if not raw:
-            continue
-        if isinstance(raw, dict):
-            continue
-        try:
-            r[field] = json.loads(raw)
-        except Exception:
-            r[field] = {"_meta_parse_error": True}
+            r[field] = None
+        elif isinstance(raw, (str, bytes)):
+            r[field] = orjson.Fragment(raw)
     return rows
 
 
@@ -319,91 +416,212 @@ def build_host_services_index(services: List[Dict[str, Any]]) -> Dict[str, List[
     return idx
 
 
-def fetch_last_by_service_ids(conn, service_ids: List[str], region: Optional[str]) -> Dict[str, Dict[str, Any]]:
-    """
-    Fetch last measurement (status, latency) for each service_id.
-    Single query (no N+1).
-    """
-    if not service_ids:
-        return {}
+@ttl_cache(ttl_seconds=60)
+def host_services_cached() -> Dict[str, List[str]]:
+    # Pure function of the services file: rebuild at most once per TTL
+    # window instead of on every targets-geo request. Service lists are
+    # pre-sorted for the searchsorted lookups in aggregate_host_health.
+    idx = build_host_services_index(load_services_cached())
+    for sids in idx.values():
+        sids.sort()
+    return idx
+
+
+# measurements_last is maintained by trigger (see database/schema.sql).
+# Set GNM_USE_MEASUREMENTS_LAST=0 on deployments whose schema predates it.
+USE_MEASUREMENTS_LAST = os.getenv("GNM_USE_MEASUREMENTS_LAST", "1") != "0"
 
-    placeholders = ", ".join(["%s"] * len(service_ids))
-    params: List[Any] = service_ids[:]
+# IN-list batching: keeps every statement well under max_allowed_packet
+# and gives the planner a predictable list size.
+SERVICE_IDS_CHUNK = 500
+SERVICE_IDS_MAX = 50_000
+
+
+# The id list is passed as ONE JSON parameter expanded via JSON_TABLE:
+# the statement shape stays fixed regardless of list length, so the
+# server's plan/parse cache keeps hitting (a variable number of %s
+# placeholders produces a new statement text on every call).
+_IN_SERVICE_IDS = """target_id IN (
+                SELECT jt.id
+                FROM JSON_TABLE(%s, '$[*]' COLUMNS(id VARCHAR(128) PATH '$')) jt
+            )"""
+
+
+async def _fetch_last_chunk(conn, service_ids: List[str], region: Optional[str]) -> List[Dict[str, Any]]:
+    params: List[Any] = [orjson.dumps(service_ids).decode()]
 
     where_region = ""
     if region:
         where_region = "AND region = %s"
         params.append(region)
 
-    sql = f"""
-        SELECT m1.target_id, m1.status, m1.latency_ms
-        FROM measurements m1
-        JOIN (
-            SELECT target_id, MAX(ts) AS max_ts
-            FROM measurements
-            WHERE target_id IN ({placeholders})
-            {where_region}
-            GROUP BY target_id
-        ) sub ON m1.target_id = sub.target_id AND m1.ts = sub.max_ts
+    if USE_MEASUREMENTS_LAST:
+        if region:
+            # One summary row per (target, region): the filter selects the
+            # requested region's latest measurement directly by PK prefix.
+            sql = f"""
+                SELECT target_id, status, latency_ms
+                FROM measurements_last
+                WHERE {_IN_SERVICE_IDS}
+                {where_region}
+            """
+        else:
+            # No region filter: pick the globally latest row per target
+            # out of the per-region summary rows (a handful per target,
+            # so the window scan stays tiny).
+            sql = f"""
+                WITH ranked AS (
+                    SELECT target_id, status, latency_ms,
+                           ROW_NUMBER() OVER (PARTITION BY target_id ORDER BY ts DESC) AS rn
+                    FROM measurements_last
+                    WHERE {_IN_SERVICE_IDS}
+                )
+                SELECT target_id, status, latency_ms
+                FROM ranked
+                WHERE rn = 1
+            """
+    else:
+        # Window function over idx_target_ts: one index range scan instead of
+        # the old self-join (two scans of measurements).
+        sql = f"""
+            WITH ranked AS (
+                SELECT target_id, status, latency_ms,
+                       ROW_NUMBER() OVER (PARTITION BY target_id ORDER BY ts DESC) AS rn
+                FROM measurements
+                WHERE {_IN_SERVICE_IDS}
+                {where_region}
+            )
+            SELECT target_id, status, latency_ms
+            FROM ranked
+            WHERE rn = 1
+        """
+
+    async with conn.cursor() as cur:
+        await cur.execute(sql, params)
+        return await cur.fetchall()
+
+
+async def fetch_last_by_service_ids(conn, service_ids: List[str], region: Optional[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch last measurement (status, latency) for each service_id.
+    Batched IN-list queries (no N+1).
+
+    Default path is a PK lookup on the measurements_last summary table
+    (O(N_targets), independent of retention depth); the window-function
+    scan over measurements is kept as a fallback.
     """
+    if not service_ids:
+        return {}
 
-    with conn.cursor() as cur:
-        cur.execute(sql, params)
-        rows = cur.fetchall()
+    if len(service_ids) > SERVICE_IDS_MAX:
+        raise HTTPException(status_code=500, detail="service id list too large")
 
     out: Dict[str, Dict[str, Any]] = {}
-    for r in rows:
-        out[r["target_id"]] = {
-            "status": int(r["status"]),
-            "latency_ms": int(r["latency_ms"]),
-        }
+    for i in range(0, len(service_ids), SERVICE_IDS_CHUNK):
+        chunk = service_ids[i:i + SERVICE_IDS_CHUNK]
+        rows = await _fetch_last_chunk(conn, chunk, region)
+        for r in rows:
+            out[r["target_id"]] = {
+                "status": int(r["status"]),
+                "latency_ms": int(r["latency_ms"]),
+            }
     return out
 
 
-def aggregate_host_health(service_ids: List[str], last_by_service: Dict[str, Dict[str, Any]]) -> Tuple[int, int]:
+def build_service_arrays(
+    last_by_service: Dict[str, Dict[str, Any]],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Columnar (SoA) view of the last-measurement map: a sorted service_id
+    array plus status and latency arrays in the same order, built once.
+    Hosts resolve their services via np.searchsorted instead of per-sid
+    dict lookups, so the whole aggregation runs on contiguous C arrays.
+    """
+    sids = sorted(last_by_service)
+    n = len(sids)
+    sid_arr = np.array(sids, dtype=np.str_)
+    status_arr = np.fromiter(
+        (last_by_service[sid]["status"] for sid in sids), dtype=np.int8, count=n
+    )
+    lat_arr = np.fromiter(
+        (last_by_service[sid]["latency_ms"] for sid in sids), dtype=np.int32, count=n
+    )
+    return sid_arr, status_arr, lat_arr
+
+
+def aggregate_host_health(
+    service_ids: List[str],
+    sid_arr: np.ndarray,
+    status_arr: np.ndarray,
+    lat_arr: np.ndarray,
+) -> Tuple[int, int]:
     """
     CRIT si au moins 1 service CRIT
     WARN si aucun CRIT mais au moins 1 WARN
     OK sinon
     """
-    statuses: List[int] = []
-    lats: List[int] = []
-
-    for sid in service_ids:
-        last = last_by_service.get(sid)
-        if not last:
-            continue
+    if not service_ids or sid_arr.size == 0:
+        return 0, 0
 
-        st = last["status"]
-        statuses.append(st)
+    query = np.array(service_ids, dtype=np.str_)
+    pos = np.minimum(np.searchsorted(sid_arr, query), sid_arr.size - 1)
+    idx = pos[sid_arr[pos] == query]
+    if idx.size == 0:
+        return 0, 0
 
-        if st > 0:
-            lat = int(last.get("latency_ms", 0))
-            if lat > 0:
-                lats.append(lat)
+    st = status_arr[idx]
 
-    if not statuses:
+    if (st == 2).any():
+        status = 2
+    elif (st == 1).any():
+        status = 1
+    else:
         return 0, 0
 
-    if 2 in statuses:
-        return 2, max(lats) if lats else 0
-    if 1 in statuses:
-        return 1, max(lats) if lats else 0
-    return 0, 0
+    lats = lat_arr[idx]
+    lats = lats[(st > 0) & (lats > 0)]
+    return status, int(lats.max()) if lats.size else 0
 
 
 # --------------------------------------------------------------------------- #
 # Rate limiting (slowapi)
 # --------------------------------------------------------------------------- #
 
-limiter = Limiter(key_func=get_remote_address)
+def _build_limiter() -> Limiter:
+    """
+    Counters are per-worker in-memory by default; deployments running
+    several uvicorn workers should point GNM_RATELIMIT_STORAGE_URI at a
+    Redis instance (e.g. redis://localhost:6379/0) so all workers share
+    the same limits — in-memory storage multiplies the effective limit
+    by the worker count. Falls back to memory storage when the
+    configured Redis is unreachable.
+    """
+    storage_uri = os.getenv("GNM_RATELIMIT_STORAGE_URI", "memory://")
+    if storage_uri.startswith("memory"):
+        return Limiter(key_func=get_remote_address)
+
+    try:
+        import redis
+
+        redis.Redis.from_url(storage_uri, socket_connect_timeout=1).ping()
+        return Limiter(key_func=get_remote_address, storage_uri=storage_uri)
+    except Exception as e:
+        logger.warning("rate limiter falling back to in-memory storage: %s", e)
+        return Limiter(key_func=get_remote_address)
+
+
+limiter = _build_limiter()
 
 
 # --------------------------------------------------------------------------- #
 # App
 # --------------------------------------------------------------------------- #
 
-app = FastAPI(title="GlobalNet Monitor API", version="0.5")
+app = FastAPI(
+    title="GlobalNet Monitor API",
+    version="0.5",
+    default_response_class=ORJSONResponse,
+)
 app.state.limiter = limiter
 
 app.add_middleware(
@@ -416,6 +634,31 @@ app.add_middleware(
 app.add_middleware(SlowAPIMiddleware)
 
 
+# --------------------------------------------------------------------------- #
+# File-cache preloading (no cold-path latency spikes)
+# --------------------------------------------------------------------------- #
+
+# Refresh just before the 60s TTL lapses so no request ever pays the
+# disk read + JSON parse on the hot path.
+CACHE_REFRESH_INTERVAL_SEC = 55
+
+
+def _refresh_file_caches() -> None:
+    load_hosts_cached.refresh()
+    load_services_cached.refresh()
+    load_targets_geo_cached.refresh()
+    host_services_cached.refresh()
+
+
+def _cache_refresher_loop() -> None:
+    while True:
+        time.sleep(CACHE_REFRESH_INTERVAL_SEC)
+        try:
+            _refresh_file_caches()
+        except Exception:
+            logger.exception("file cache refresh failed")
+
+
 @app.exception_handler(RateLimitExceeded)
 def rate_limit_handler(request: Request, exc: RateLimitExceeded):
     # slowapi injects proper headers
@@ -423,9 +666,17 @@ def rate_limit_handler(request: Request, exc: RateLimitExceeded):
 
 
 @app.on_event("startup")
-def on_startup():
+async def on_startup():
     # DB pool
-    init_db_pool()
+    await init_db_pool()
+    app.state.pool = DB_POOL
+
+    # Prime file caches and keep them warm from a daemon thread
+    try:
+        _refresh_file_caches()
+    except Exception:
+        logger.exception("file cache preload failed")
+    threading.Thread(target=_cache_refresher_loop, daemon=True).start()
 
     # Prometheus
     Instrumentator().instrument(app).expose(app, endpoint="/metrics", include_in_schema=False)
@@ -437,9 +688,13 @@ def on_startup():
 # Endpoints
 # --------------------------------------------------------------------------- #
 
-@app.get("/api/last", response_model=List[LastMeasurement])
+@app.get(
+    "/api/last",
+    response_model=None,
+    responses={200: {"model": List[LastMeasurement]}},
+)
 @limiter.limit("60/minute")
-def get_last_measurements(
+async def get_last_measurements(
     region: Optional[str] = Query(None),
     limit: int = Query(100, ge=1, le=500),
     offset: int = Query(0, ge=0, le=1_000_000),
@@ -461,17 +716,21 @@ def get_last_measurements(
     """
     params.extend([limit, offset])
 
-    with conn.cursor() as cur:
-        cur.execute(sql, params)
-        rows = cur.fetchall()
+    async with conn.cursor() as cur:
+        await cur.execute(sql, params)
+        rows = await cur.fetchall()
 
-    parse_meta_json(rows, field="meta")
-    return rows
+    wrap_raw_meta(rows, field="meta")
+    return ORJSONResponse(rows)
 
 
-@app.get("/api/last-by-target", response_model=List[LastByTarget])
+@app.get(
+    "/api/last-by-target",
+    response_model=None,
+    responses={200: {"model": List[LastByTarget]}},
+)
 @limiter.limit("60/minute")
-def get_last_by_target(
+async def get_last_by_target(
     region: Optional[str] = Query(None),
     conn=Depends(get_db_conn),
 ):
@@ -482,68 +741,131 @@ def get_last_by_target(
         where = "WHERE region = %s"
         params.append(region)
 
+    # Window function over idx_target_ts: one index range scan instead of
+    # the old self-join (two scans of measurements).
     sql = f"""
-        SELECT m1.target_id, m1.host_id, m1.type, m1.status,
-               m1.latency_ms, m1.ts, m1.region, m1.meta_json AS meta
-        FROM measurements m1
-        JOIN (
-            SELECT target_id, MAX(ts) AS max_ts
+        WITH ranked AS (
+            SELECT target_id, host_id, type, status, latency_ms, ts, region,
+                   meta_json AS meta,
+                   ROW_NUMBER() OVER (PARTITION BY target_id ORDER BY ts DESC) AS rn
             FROM measurements
             {where}
-            GROUP BY target_id
-        ) sub ON m1.target_id = sub.target_id AND m1.ts = sub.max_ts
-        ORDER BY m1.target_id ASC
+        )
+        SELECT target_id, host_id, type, status, latency_ms, ts, region, meta
+        FROM ranked
+        WHERE rn = 1
+        ORDER BY target_id ASC
     """
 
-    with conn.cursor() as cur:
-        cur.execute(sql, params)
-        rows = cur.fetchall()
+    async with conn.cursor() as cur:
+        await cur.execute(sql, params)
+        rows = await cur.fetchall()
+
+    wrap_raw_meta(rows, field="meta")
+    return ORJSONResponse(rows)
 
-    parse_meta_json(rows, field="meta")
-    return rows
 
+# Windows wider than this are bucketed server-side; ?raw=true bypasses.
+DOWNSAMPLE_MIN_MINUTES = 180
+DOWNSAMPLE_MAX_POINTS = 500
 
-@app.get("/api/timeseries", response_model=List[TimeSeriesPoint])
+
+@app.get(
+    "/api/timeseries",
+    response_model=None,
+    responses={
+        200: {
+            "description": "NDJSON stream, one TimeSeriesPoint object per line",
+            "content": {"application/x-ndjson": {}},
+        }
+    },
+)
 @limiter.limit("60/minute")
-def get_timeseries(
+async def get_timeseries(
     target_id: str,
     minutes: int = Query(60, ge=1, le=1440),
     region: Optional[str] = Query(None),
-    conn=Depends(get_db_conn),
+    raw: bool = Query(False),
+    pool: Any = Depends(get_pool),
 ):
-    end_ts = dt.datetime.utcnow()
-    start_ts = end_ts - dt.timedelta(minutes=minutes)
-
-    params: List[Any] = [target_id, start_ts, end_ts]
+    # Window bounds are computed DB-side (ts is stored in UTC, session
+    # time_zone is +00:00): no drift between Python's clock and the DB,
+    # and one less pair of datetime parameters per query.
+    params: List[Any] = [target_id, minutes]
     where_region = ""
 
     if region:
         where_region = "AND region = %s"
         params.append(region)
 
-    sql = f"""
-        SELECT ts, status, latency_ms
-        FROM measurements
-        WHERE target_id = %s
-          AND ts BETWEEN %s AND %s
-          {where_region}
-        ORDER BY ts ASC
-    """
-
-    with conn.cursor() as cur:
-        cur.execute(sql, params)
-        rows = cur.fetchall()
-
-    return rows
+    if raw or minutes <= DOWNSAMPLE_MIN_MINUTES:
+        sql = f"""
+            SELECT ts, status, latency_ms
+            FROM measurements
+            WHERE target_id = %s
+              AND ts >= UTC_TIMESTAMP() - INTERVAL %s MINUTE
+              {where_region}
+            ORDER BY ts ASC
+        """
+    else:
+        # Wide windows are downsampled server-side: a dashboard renders
+        # ~hundreds of pixels, so returning every raw sample only burns
+        # bandwidth and serialization time. One point per bucket, worst
+        # status wins, latency averaged.
+        bucket_secs = max(60, minutes * 60 // DOWNSAMPLE_MAX_POINTS)
+        params.append(bucket_secs)
+        sql = f"""
+            SELECT MIN(ts) AS ts, MAX(status) AS status,
+                   CAST(AVG(latency_ms) AS UNSIGNED) AS latency_ms
+            FROM measurements
+            WHERE target_id = %s
+              AND ts >= UTC_TIMESTAMP() - INTERVAL %s MINUTE
+              {where_region}
+            GROUP BY FLOOR(UNIX_TIMESTAMP(ts) / %s)
+            ORDER BY ts ASC
+        """
+
+    # The connection is acquired here (not via get_db_conn) because a
+    # yield-dependency's release runs when the handler returns the
+    # response object, BEFORE the body is streamed — the connection
+    # would go back to the pool with the server-side cursor still in
+    # flight. The BackgroundTask releases it only after the stream is
+    # fully consumed (or aborted).
+    try:
+        conn = await asyncio.wait_for(pool.acquire(), timeout=POOL_ACQUIRE_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=503, detail="db pool exhausted")
+
+    async def stream():
+        # Unbuffered (server-side) cursor: rows are fetched and emitted
+        # one at a time, so memory stays flat regardless of window size
+        # and the first byte goes out before the full result is read.
+        async with conn.cursor(SS_DICT_CURSOR) as cur:
+            await cur.execute(sql, params)
+            while True:
+                row = await cur.fetchone()
+                if row is None:
+                    break
+                yield orjson.dumps(row) + b"\n"
+
+    return StreamingResponse(
+        stream(),
+        media_type="application/x-ndjson",
+        background=BackgroundTask(pool.release, conn),
+    )
 
 
-@app.get("/api/meta/targets", response_model=List[TargetMeta])
+@app.get(
+    "/api/meta/targets",
+    response_model=None,
+    responses={200: {"model": List[TargetMeta]}},
+)
 @limiter.limit("60/minute")
 def get_targets_meta():
     # TTL cache 60s
     services = load_services_cached()
     hosts = load_hosts_cached()
-    out: List[TargetMeta] = []
+    out: List[TargetMetaRow] = []
 
     for s in services:
         sid = s.get("service_id")
@@ -554,7 +876,7 @@ def get_targets_meta():
         host = hosts.get(host_id) if host_id else None
 
         out.append(
-            TargetMeta(
+            TargetMetaRow(
                 id=sid,
                 type=s.get("type", "unknown"),
                 host_id=host_id,
@@ -562,26 +884,75 @@ def get_targets_meta():
                 enabled=s.get("enabled", True),
             )
         )
-    return out
+    return Response(content=msgspec.json.encode(out), media_type="application/json")
+
+
+# Short-TTL cache of the final /api/meta/targets-geo payload, keyed by
+# (region, limit_hosts). Stores pre-serialized JSON bytes so cache hits
+# skip aggregation, Pydantic and serialization entirely. region is a
+# free-form query string, so the cache is bounded: expired entries are
+# pruned on insert and the size is hard-capped.
+TARGETS_GEO_TTL = int(os.getenv("GNM_TARGETS_GEO_TTL", "15"))
+GEO_CACHE_MAX_ENTRIES = 256
+_GEO_CACHE: Dict[Tuple[Optional[str], int], Tuple[float, bytes]] = {}
+# One lock per key: concurrent misses for the same key collapse into a
+# single DB hit without serializing misses for unrelated keys.
+_GEO_CACHE_LOCKS: Dict[Tuple[Optional[str], int], asyncio.Lock] = {}
+
+
+def _geo_cache_put(cache_key: Tuple[Optional[str], int], payload: bytes) -> None:
+    now = time.time()
+    for stale in [k for k, (expires_at, _) in _GEO_CACHE.items() if expires_at <= now]:
+        del _GEO_CACHE[stale]
+        _GEO_CACHE_LOCKS.pop(stale, None)
+
+    # Cap after pruning: evict the entry closest to expiry so a burst of
+    # bogus regions cannot grow the dict without bound.
+    while len(_GEO_CACHE) >= GEO_CACHE_MAX_ENTRIES:
+        oldest = min(_GEO_CACHE, key=lambda k: _GEO_CACHE[k][0])
+        del _GEO_CACHE[oldest]
+        _GEO_CACHE_LOCKS.pop(oldest, None)
+
+    _GEO_CACHE[cache_key] = (now + TARGETS_GEO_TTL, payload)
 
 
 @app.get("/api/meta/targets-geo", response_model=List[TargetGeo])
 @limiter.limit("10/minute")  # costly endpoint
-def get_targets_geo(
+async def get_targets_geo(
     region: Optional[str] = Query(None),
     limit_hosts: int = Query(200, ge=1, le=500),
     conn=Depends(get_db_conn),
 ):
+    cache_key = (region, limit_hosts)
+    hit = _GEO_CACHE.get(cache_key)
+    if hit is not None and time.time() < hit[0]:
+        return Response(content=hit[1], media_type="application/json")
+
+    lock = _GEO_CACHE_LOCKS.setdefault(cache_key, asyncio.Lock())
+    async with lock:
+        # Double-check: another request may have filled the cache while
+        # this one waited on the lock (collapses concurrent misses into
+        # a single DB hit).
+        hit = _GEO_CACHE.get(cache_key)
+        if hit is not None and time.time() < hit[0]:
+            return Response(content=hit[1], media_type="application/json")
+
+        payload = await _compute_targets_geo(conn, region, limit_hosts)
+        _geo_cache_put(cache_key, payload)
+
+    return Response(content=payload, media_type="application/json")
+
+
+async def _compute_targets_geo(conn, region: Optional[str], limit_hosts: int) -> bytes:
     geo_raw = load_targets_geo_cached()
     if not geo_raw:
-        return []
+        return b"[]"
 
     # Limit number of hosts for safety
     geo_raw = geo_raw[:limit_hosts]
 
-    services = load_services_cached()
     hosts = load_hosts_cached()
-    host_services = build_host_services_index(services)
+    host_services = host_services_cached()
 
     # Only fetch service_ids for the hosts present in geo_raw (avoid huge IN lists)
     selected_host_ids: List[str] = []
@@ -594,21 +965,22 @@ def get_targets_geo(
     for hid in selected_host_ids:
         all_service_ids.extend(host_services.get(hid, []))
 
-    last_by_service = fetch_last_by_service_ids(conn, all_service_ids, region)
+    last_by_service = await fetch_last_by_service_ids(conn, all_service_ids, region)
+    sid_arr, status_arr, lat_arr = build_service_arrays(last_by_service)
 
-    out: List[TargetGeo] = []
+    out: List[TargetGeoRow] = []
     for item in geo_raw:
         hid = item.get("host_id") or item.get("id")
         if not hid:
             continue
 
         sids = host_services.get(hid, [])
-        status, latency = aggregate_host_health(sids, last_by_service)
+        status, latency = aggregate_host_health(sids, sid_arr, status_arr, lat_arr)
 
         name = item.get("name") or hosts.get(hid, {}).get("name") or hid
 
         out.append(
-            TargetGeo(
+            TargetGeoRow(
                 id=hid,
                 name=name,
                 lat=float(item["lat"]),
@@ -618,7 +990,7 @@ def get_targets_geo(
             )
         )
 
-    return out
+    return msgspec.json.encode(out)
 
 
 @app.get("/health")
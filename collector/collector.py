@@ -34,28 +34,42 @@ Objectifs (version moins sensible, sans casser l'existant) :
 - Region dynamique basée sur IP publique (geo-IP) + cache TTL local + override ENV
 
 Dépendances :
-- requests, PyYAML, pymysql, dnspython
+- aiohttp, aiodns, requests, PyYAML, pymysql, orjson
+- icmplib (optionnel : ping sans subprocess)
 """
 from __future__ import annotations
 
+import asyncio
+import atexit
 import datetime as dt
 import json
+import logging
 import os
 import socket
 import ssl
-import subprocess
 import sys
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
-import dns.resolver
+import aiodns
+import aiohttp
+import orjson
 import pymysql
 import requests
 import yaml
 
+# icmplib évite le fork/exec de /bin/ping par sonde ; optionnel, on
+# retombe sur le subprocess si absent ou si les sockets ICMP "unprivileged"
+# ne sont pas autorisées (sysctl net.ipv4.ping_group_range).
+try:
+    import icmplib
+except ImportError:  # pragma: no cover
+    icmplib = None
+
 # --------------------------------------------------------------------------- #
 # Paths de configuration
 # --------------------------------------------------------------------------- #
@@ -71,15 +85,58 @@ SERVICES_PATH = PROJECT_ROOT / "config" / "services.json"
 PROBE_CACHE_PATH = PROJECT_ROOT / "config" / "probe_cache.json"
 PROBE_CACHE_TTL_SEC = 24 * 3600  # 24h
 
-# Anti faux positifs (2-strikes) : hard down doit être confirmé 2 fois
-FAIL_STREAK: Dict[str, int] = {}
-OK_STREAK: Dict[str, int] = {}
+# Anti faux positifs (2-strikes) : hard down doit être confirmé 2 fois.
+# service_id -> [fail, ok] ; purgé des services retirés à chaque reload.
+STREAKS: Dict[str, List[int]] = {}
+
+# Session HTTP partagée (keep-alive entre cycles), créée dans la boucle
+# d'événements au démarrage.
+SESSION: Optional[aiohttp.ClientSession] = None
+
+# En-têtes par défaut de la session (jamais reconstruits par requête).
+_UA_HEADERS = {"User-Agent": "GNM-Collector/1.0"}
+
+# Résolveur aiodns partagé (c-ares) : construit une fois dans la boucle
+# d'événements plutôt qu'à chaque check_dns (relecture de /etc/resolv.conf
+# et état nameservers à chaque instanciation sinon).
+RESOLVER: Optional[aiodns.DNSResolver] = None
+
+# Cache DNS local : host -> (ip ou None si NXDOMAIN, expiration epoch).
+# Évite un getaddrinfo par check tcp/ssl_cert à chaque cycle ; les échecs
+# sont cachés plus longtemps pour ne pas marteler le résolveur.
+DNS_CACHE: Dict[str, Tuple[Optional[str], float]] = {}
+DNS_CACHE_TTL_SEC = 300
+DNS_CACHE_NEG_TTL_SEC = 3600
+
+# Contexte TLS partagé (la construction recharge le bundle CA à chaque fois).
+_SSL_CTX = ssl.create_default_context()
+
+# Cache d'expiration de certificat : (host, port) -> (not_after, vérifié à).
+# L'échéance d'un cert ne bouge pas d'un cycle à l'autre ; on ne refait le
+# handshake complet qu'une fois par heure (ou après un échec).
+CERT_CACHE: Dict[Tuple[str, int], Tuple[dt.datetime, float]] = {}
+CERT_CACHE_TTL_SEC = 3600
 
 
 # --------------------------------------------------------------------------- #
 # Loaders
 # --------------------------------------------------------------------------- #
 
+# Cache de parse JSON clé par mtime : services.json est rechargé à chaque
+# cycle mais change rarement, le re-parse ne coûte alors qu'un stat().
+_json_cache: Dict[Path, Tuple[int, Any]] = {}
+
+
+def _load_json(path: Path) -> Any:
+    mtime_ns = path.stat().st_mtime_ns
+    hit = _json_cache.get(path)
+    if hit is not None and hit[0] == mtime_ns:
+        return hit[1]
+    data = orjson.loads(path.read_bytes())
+    _json_cache[path] = (mtime_ns, data)
+    return data
+
+
 def load_config() -> Dict[str, Any]:
     """Charge la configuration YAML globale."""
     if not CONFIG_PATH.exists():
@@ -92,8 +149,7 @@ def load_hosts() -> Dict[str, Dict[str, Any]]:
     """Charge hosts.json et renvoie un dict host_id -> host_object."""
     if not HOSTS_PATH.exists():
         raise RuntimeError(f"hosts file not found: {HOSTS_PATH}")
-    with HOSTS_PATH.open(encoding="utf-8") as fh:
-        hosts_list = json.load(fh)
+    hosts_list = _load_json(HOSTS_PATH)
 
     hosts: Dict[str, Dict[str, Any]] = {}
     for h in hosts_list:
@@ -108,8 +164,7 @@ def load_services() -> List[Dict[str, Any]]:
     """Charge services.json et renvoie la liste des services enabled."""
     if not SERVICES_PATH.exists():
         raise RuntimeError(f"services file not found: {SERVICES_PATH}")
-    with SERVICES_PATH.open(encoding="utf-8") as fh:
-        services = json.load(fh)
+    services = _load_json(SERVICES_PATH)
     return [s for s in services if s.get("enabled", True)]
 
 
@@ -117,17 +172,39 @@ def load_services() -> List[Dict[str, Any]]:
 # Logging helpers
 # --------------------------------------------------------------------------- #
 
+# logging au lieu de print : le timestamp n'est formaté par le Formatter
+# qu'au moment de l'émission, et le format %s est différé (rien n'est
+# construit si le niveau est désactivé). INFO -> stdout, ERROR -> stderr
+# comme avant.
+LOGGER = logging.getLogger("gnm.collector")
+
+_log_fmt = logging.Formatter(
+    "[%(levelname)s] %(asctime)s.%(msecs)03d %(message)s",
+    datefmt="%Y-%m-%dT%H:%M:%S",
+)
+
+_stdout_handler = logging.StreamHandler(sys.stdout)
+_stdout_handler.setFormatter(_log_fmt)
+_stdout_handler.addFilter(lambda record: record.levelno < logging.ERROR)
+
+_stderr_handler = logging.StreamHandler(sys.stderr)
+_stderr_handler.setFormatter(_log_fmt)
+_stderr_handler.setLevel(logging.ERROR)
+
+LOGGER.addHandler(_stdout_handler)
+LOGGER.addHandler(_stderr_handler)
+LOGGER.setLevel(logging.INFO)
+
+
 def log_info(msg: str) -> None:
-    ts = dt.datetime.utcnow().isoformat(timespec="milliseconds")
-    print(f"[INFO] {ts} {msg}", file=sys.stdout, flush=True)
+    LOGGER.info("%s", msg)
 
 
 def log_error(msg: str, exc: Optional[BaseException] = None) -> None:
-    ts = dt.datetime.utcnow().isoformat(timespec="milliseconds")
-    err = f"[ERROR] {ts} {msg}"
     if exc:
-        err += f" exception={exc}"
-    print(err, file=sys.stderr, flush=True)
+        LOGGER.error("%s exception=%s", msg, exc)
+    else:
+        LOGGER.error("%s", msg)
 
 
 # --------------------------------------------------------------------------- #
@@ -141,47 +218,51 @@ def get_db_conn(db_cfg: Dict[str, Any]) -> pymysql.Connection:
         user=db_cfg["user"],
         password=db_cfg["password"],
         database=db_cfg["database"],
-        autocommit=True,
+        # autocommit off : un seul COMMIT (fsync) par cycle au lieu
+        # d'un par INSERT implicite.
+        autocommit=False,
         charset="utf8mb4",
         init_command="SET time_zone = '+00:00'",
     )
 
 
 
-def insert_measurement(
+def insert_measurements(
     conn: pymysql.Connection,
-    ts: dt.datetime,
-    region: str,
-    project_id: Optional[int],
-    target_id: str,
-    host_id: Optional[str],
-    type: str,
-    status: int,
-    latency_ms: int,
-    meta: Dict[str, Any],
+    results: List[Dict[str, Any]],
 ) -> None:
-    """Insert d’une mesure dans la table measurements incluant host_id."""
+    """
+    Insert par lot des mesures d'un cycle (incluant host_id).
+
+    executemany laisse PyMySQL réécrire l'INSERT en multi-VALUES :
+    un seul aller-retour réseau par cycle au lieu d'un par mesure.
+    meta_json est encodé via orjson.dumps ; les bytes produits sont
+    échappés tels quels par PyMySQL vers la colonne JSON.
+    """
+    if not results:
+        return
+
     sql = """
         INSERT INTO measurements
         (ts, region, project_id, target_id, host_id, type, status, latency_ms, meta_json)
         VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
     """
-    meta_json = json.dumps(meta) if meta else None
-    with conn.cursor() as cur:
-        cur.execute(
-            sql,
-            (
-                ts,
-                region,
-                project_id,
-                target_id,
-                host_id,
-                type,
-                status,
-                latency_ms,
-                meta_json,
-            ),
+    rows = [
+        (
+            r["ts"],
+            r["region"],
+            r["project_id"],
+            r["target_id"],
+            r["host_id"],
+            r["type"],
+            r["status"],
+            r["latency_ms"],
+            orjson.dumps(r["meta"]) if r["meta"] else None,
         )
+        for r in results
+    ]
+    with conn.cursor() as cur:
+        cur.executemany(sql, rows)
 
 
 # --------------------------------------------------------------------------- #
@@ -220,36 +301,38 @@ def resolve_host_address(service: Dict[str, Any], host: Optional[Dict[str, Any]]
 # Probe discovery (region dynamique basée sur IP publique)
 # --------------------------------------------------------------------------- #
 
+# Table pays -> région construite une fois à l'import : un seul lookup
+# de dict au lieu de six sets reconstruits à chaque appel.
+_EU = frozenset({"FR","ES","PT","BE","NL","DE","LU","IT","GB","IE","CH","AT","SE","NO","DK","FI","PL","CZ","SK","HU","RO","BG","GR","HR","SI","EE","LV","LT"})
+_NA = frozenset({"US","CA","MX"})
+_SA = frozenset({"BR","AR","CL","CO","PE","UY","PY","BO","EC","VE"})
+_AF = frozenset({"MA","DZ","TN","EG","ZA","NG","KE","GH","SN","CI","CM","ET","UG","TZ","RW"})
+_AS = frozenset({"TR","SA","AE","QA","KW","OM","BH","IN","PK","BD","CN","JP","KR","SG","MY","TH","VN","ID","PH","HK","TW"})
+_OC = frozenset({"AU","NZ"})
+
+COUNTRY_TO_REGION: Dict[str, str] = {
+    **{c: "EU" for c in _EU},
+    **{c: "NA" for c in _NA},
+    **{c: "SA" for c in _SA},
+    **{c: "AF" for c in _AF},
+    **{c: "AS" for c in _AS},
+    **{c: "OC" for c in _OC},
+}
+
+
 def _country_to_region(country_code: Optional[str]) -> str:
     if not country_code:
         return "UNKNOWN"
-    cc = country_code.upper()
-
-    EU = {"FR","ES","PT","BE","NL","DE","LU","IT","GB","IE","CH","AT","SE","NO","DK","FI","PL","CZ","SK","HU","RO","BG","GR","HR","SI","EE","LV","LT"}
-    NA = {"US","CA","MX"}
-    SA = {"BR","AR","CL","CO","PE","UY","PY","BO","EC","VE"}
-    AF = {"MA","DZ","TN","EG","ZA","NG","KE","GH","SN","CI","CM","ET","UG","TZ","RW"}
-    AS = {"TR","SA","AE","QA","KW","OM","BH","IN","PK","BD","CN","JP","KR","SG","MY","TH","VN","ID","PH","HK","TW"}
-    OC = {"AU","NZ"}
-
-    if cc in EU: return "EU"
-    if cc in NA: return "NA"
-    if cc in SA: return "SA"
-    if cc in AF: return "AF"
-    if cc in AS: return "AS"
-    if cc in OC: return "OC"
-    return "OTHER"
+    return COUNTRY_TO_REGION.get(country_code.upper(), "OTHER")
 
 
 def _load_probe_cache() -> Optional[Dict[str, Any]]:
+    """Renvoie le cache brut (même périmé) ; la politique d'âge est au caller."""
     try:
         if not PROBE_CACHE_PATH.exists():
             return None
         data = json.loads(PROBE_CACHE_PATH.read_text(encoding="utf-8"))
-        ts = float(data.get("_cached_at", 0))
-        if not ts:
-            return None
-        if time.time() - ts > PROBE_CACHE_TTL_SEC:
+        if not float(data.get("_cached_at", 0)):
             return None
         return data
     except Exception:
@@ -267,28 +350,8 @@ def _save_probe_cache(data: Dict[str, Any]) -> None:
         pass
 
 
-def discover_probe_identity(cfg_region_fallback: str, timeout_sec: int = 4) -> Dict[str, Any]:
-    """
-    Détermine automatiquement la région de la sonde via IP publique + geo-IP.
-    - Override via env
-    - Cache local TTL 24h
-    - Fallback sur cfg['region'] si tout échoue
-    """
-    env_region = os.getenv("GNM_PROBE_REGION")
-    if env_region:
-        return {
-            "probe_region": env_region,
-            "probe_country": os.getenv("GNM_PROBE_COUNTRY"),
-            "probe_city": os.getenv("GNM_PROBE_CITY"),
-            "probe_public_ip": os.getenv("GNM_PROBE_PUBLIC_IP"),
-            "probe_source": "env",
-        }
-
-    cached = _load_probe_cache()
-    if cached and cached.get("probe_region"):
-        cached["probe_source"] = "cache"
-        return cached
-
+def _fetch_probe_identity(cfg_region_fallback: str, timeout_sec: int) -> Dict[str, Any]:
+    """Résolution réseau IP publique + geo-IP (bloquante), cache mis à jour."""
     public_ip = None
     try:
         r = requests.get("https://api.ipify.org?format=json", timeout=timeout_sec)
@@ -324,10 +387,52 @@ def discover_probe_identity(cfg_region_fallback: str, timeout_sec: int = 4) -> D
     return data
 
 
+def discover_probe_identity(cfg_region_fallback: str, timeout_sec: int = 4) -> Dict[str, Any]:
+    """
+    Détermine automatiquement la région de la sonde via IP publique + geo-IP.
+    - Override via env
+    - Cache local TTL 24h : frais (< TTL/2) => retour direct sans réseau ;
+      vieillissant (TTL/2..TTL) => retour du cache + refresh en arrière-plan ;
+      on ne bloque sur les appels HTTPS que sans aucun cache exploitable
+    - Fallback sur cfg['region'] si tout échoue
+    """
+    env_region = os.getenv("GNM_PROBE_REGION")
+    if env_region:
+        return {
+            "probe_region": env_region,
+            "probe_country": os.getenv("GNM_PROBE_COUNTRY"),
+            "probe_city": os.getenv("GNM_PROBE_CITY"),
+            "probe_public_ip": os.getenv("GNM_PROBE_PUBLIC_IP"),
+            "probe_source": "env",
+        }
+
+    cached = _load_probe_cache()
+    if cached and cached.get("probe_region"):
+        age = time.time() - float(cached.get("_cached_at", 0))
+        if age < PROBE_CACHE_TTL_SEC:
+            cached["probe_source"] = "cache"
+            if age >= PROBE_CACHE_TTL_SEC / 2:
+                # Cache vieillissant : on sert l'existant et on rafraîchit
+                # sans retarder le démarrage du premier cycle.
+                threading.Thread(
+                    target=_fetch_probe_identity,
+                    args=(cfg_region_fallback, timeout_sec),
+                    daemon=True,
+                ).start()
+            return cached
+
+    return _fetch_probe_identity(cfg_region_fallback, timeout_sec)
+
+
 # --------------------------------------------------------------------------- #
 # Threshold helpers (moins sensible)
 # --------------------------------------------------------------------------- #
 
+def _elapsed_ms(start_ns: int) -> int:
+    """Millisecondes écoulées depuis start_ns (time.monotonic_ns), en entier."""
+    return (time.monotonic_ns() - start_ns) // 1_000_000
+
+
 def _tint(thresholds: Dict[str, Any], key: str, default: int) -> int:
     try:
         v = thresholds.get(key, default)
@@ -336,25 +441,124 @@ def _tint(thresholds: Dict[str, Any], key: str, default: int) -> int:
         return default
 
 
+# --------------------------------------------------------------------------- #
+# Résolution DNS cachée (checks tcp / ssl_cert)
+# --------------------------------------------------------------------------- #
+
+async def resolve_cached(host: str) -> str:
+    """
+    Résout host -> IP via le cache TTL local (getaddrinfo sinon).
+
+    Les NXDOMAIN sont mémorisés avec un TTL long (DNS_CACHE_NEG_TTL_SEC)
+    et re-levés sans requête réseau tant qu'ils sont frais.
+    """
+    ip, expires_at = DNS_CACHE.get(host, (None, 0.0))
+    if expires_at > time.time():
+        if ip is None:
+            raise socket.gaierror(f"dns_negative_cache:{host}")
+        return ip
+
+    loop = asyncio.get_running_loop()
+    try:
+        infos = await loop.getaddrinfo(host, None, type=socket.SOCK_STREAM)
+    except socket.gaierror:
+        DNS_CACHE[host] = (None, time.time() + DNS_CACHE_NEG_TTL_SEC)
+        raise
+
+    ip = infos[0][4][0]
+    DNS_CACHE[host] = (ip, time.time() + DNS_CACHE_TTL_SEC)
+    return ip
+
+
+# --------------------------------------------------------------------------- #
+# Mesure séparée handshake / réponse (checks HTTP)
+# --------------------------------------------------------------------------- #
+
+def _make_trace_config() -> aiohttp.TraceConfig:
+    """
+    TraceConfig qui note le coût d'établissement de connexion (DNS+TCP+TLS)
+    dans le trace_request_ctx passé par le check. Sur connexion keep-alive
+    réutilisée, les callbacks ne se déclenchent pas : connect_ms reste à 0.
+    """
+    tc = aiohttp.TraceConfig()
+
+    async def on_create_start(session, ctx, params) -> None:
+        if ctx.trace_request_ctx is not None:
+            ctx.trace_request_ctx["_conn_start_ns"] = time.monotonic_ns()
+
+    async def on_create_end(session, ctx, params) -> None:
+        if ctx.trace_request_ctx is not None:
+            t0_ns = ctx.trace_request_ctx.get("_conn_start_ns")
+            if t0_ns is not None:
+                ctx.trace_request_ctx["connect_ms"] = _elapsed_ms(t0_ns)
+
+    tc.on_connection_create_start.append(on_create_start)
+    tc.on_connection_create_end.append(on_create_end)
+    return tc
+
+
 # --------------------------------------------------------------------------- #
 # Checks internes — CRIT = hard down uniquement
+# (coroutines : tous les checks d'un cycle partagent la boucle d'événements,
+#  plus de thread bloquant par service)
 # --------------------------------------------------------------------------- #
 
-def check_ping(host: str, timeout_sec: int, thresholds: Dict[str, Any]) -> Tuple[int, int, Dict[str, Any]]:
-    start = time.perf_counter()
+async def _ping_subprocess(host: str, timeout_sec: int) -> Tuple[bool, int, Dict[str, Any]]:
+    """Fallback via /bin/ping. Renvoie (alive, latency_ms, meta partiel)."""
+    start_ns = time.monotonic_ns()
+    meta: Dict[str, Any] = {}
+    proc = await asyncio.create_subprocess_exec(
+        "ping", "-c", "1", "-W", str(timeout_sec), host,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        _out, err = await asyncio.wait_for(proc.communicate(), timeout=timeout_sec + 1)
+    except asyncio.TimeoutError:
+        proc.kill()
+        # Moisson du processus tué : sans wait(), zombie jusqu'au cycle suivant.
+        await proc.wait()
+        raise
+    latency_ms = _elapsed_ms(start_ns)
+    meta["returncode"] = proc.returncode
+    if proc.returncode != 0:
+        meta["error"] = err.decode(errors="replace").strip() or "ping_failed"
+        return False, latency_ms, meta
+    return True, latency_ms, meta
+
+
+async def check_ping(host: str, timeout_sec: int, thresholds: Dict[str, Any]) -> Tuple[int, int, Dict[str, Any]]:
+    start_ns = time.monotonic_ns()
     meta: Dict[str, Any] = {}
 
     WARN_MS = _tint(thresholds, "ping_warn_ms", 500)
     VERY_SLOW_MS = _tint(thresholds, "ping_very_slow_ms", 1500)
 
     try:
-        cmd = ["ping", "-c", "1", "-W", str(timeout_sec), host]
-        completed = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout_sec + 1)
-        latency_ms = int((time.perf_counter() - start) * 1000)
-        meta["returncode"] = completed.returncode
-
-        if completed.returncode != 0:
-            meta["error"] = completed.stderr.strip() or "ping_failed"
+        alive = False
+        latency_ms = 0
+        used_icmplib = False
+
+        if icmplib is not None:
+            try:
+                # Socket ICMP directe : la latence mesurée est le RTT réel,
+                # pas RTT + démarrage d'un processus ping.
+                host_obj = await icmplib.async_ping(
+                    host, count=1, timeout=timeout_sec, privileged=False
+                )
+                alive = host_obj.is_alive
+                latency_ms = int(host_obj.avg_rtt)
+                used_icmplib = True
+                if not alive:
+                    meta["error"] = "ping_failed"
+            except icmplib.SocketPermissionError:
+                used_icmplib = False
+
+        if not used_icmplib:
+            alive, latency_ms, sub_meta = await _ping_subprocess(host, timeout_sec)
+            meta.update(sub_meta)
+
+        if not alive:
             meta["hard_down"] = True
             return 2, latency_ms, meta
 
@@ -365,30 +569,48 @@ def check_ping(host: str, timeout_sec: int, thresholds: Dict[str, Any]) -> Tuple
         meta["slow_level"] = "very" if latency_ms >= VERY_SLOW_MS else "mild"
         return 1, latency_ms, meta
 
+    except asyncio.TimeoutError:
+        # str(TimeoutError()) est vide : erreur explicite comme check_http.
+        meta["error"] = "timeout"
+        meta["hard_down"] = True
+        return 2, _elapsed_ms(start_ns), meta
+
     except Exception as exc:
         meta["error"] = str(exc)
         meta["hard_down"] = True
-        return 2, int((time.perf_counter() - start) * 1000), meta
+        return 2, _elapsed_ms(start_ns), meta
 
 
-def check_http(url: str, timeout_sec: int, thresholds: Dict[str, Any]) -> Tuple[int, int, Dict[str, Any]]:
-    start = time.perf_counter()
+async def check_http(url: str, timeout_sec: int, thresholds: Dict[str, Any]) -> Tuple[int, int, Dict[str, Any]]:
+    start_ns = time.monotonic_ns()
     meta: Dict[str, Any] = {}
 
     WARN_MS = _tint(thresholds, "http_warn_ms", 8000)
     VERY_SLOW_MS = _tint(thresholds, "http_very_slow_ms", 20000)
 
     try:
-        resp = requests.get(
+        trace: Dict[str, Any] = {}
+        async with SESSION.get(
             url,
-            timeout=timeout_sec,
-            headers={"User-Agent": "GNM-Collector/1.0"},
+            timeout=aiohttp.ClientTimeout(total=timeout_sec),
             allow_redirects=True,
-        )
-        latency_ms = int((time.perf_counter() - start) * 1000)
-        code = resp.status_code
+            trace_request_ctx=trace,
+        ) as resp:
+            await resp.read()
+            code = resp.status
+        latency_ms = _elapsed_ms(start_ns)
         meta["http_status"] = code
 
+        # Séparer l'établissement de connexion (DNS+TCP+TLS, payé seulement
+        # à froid) du temps de réponse serveur : le seuil WARN ne doit pas
+        # déclencher sur un simple handshake après redémarrage.
+        connect_ms = int(trace.get("connect_ms", 0))
+        response_ms = max(0, latency_ms - connect_ms)
+        meta["total_ms"] = latency_ms
+        meta["response_ms"] = response_ms
+        if connect_ms:
+            meta["connect_ms"] = connect_ms
+
         # Codes HTTP : dégradation, pas hard down
         if code >= 500:
             meta["reason"] = "http_5xx"
@@ -398,43 +620,40 @@ def check_http(url: str, timeout_sec: int, thresholds: Dict[str, Any]) -> Tuple[
             meta["reason"] = "http_4xx"
             return 1, latency_ms, meta
 
-        # Succès 2xx/3xx : latence => WARN si lente
-        if latency_ms < WARN_MS:
+        # Succès 2xx/3xx : latence (hors handshake) => WARN si lente
+        if response_ms < WARN_MS:
             return 0, latency_ms, meta
 
         meta["reason"] = "slow_http"
-        meta["slow_level"] = "very" if latency_ms >= VERY_SLOW_MS else "mild"
+        meta["slow_level"] = "very" if response_ms >= VERY_SLOW_MS else "mild"
         return 1, latency_ms, meta
 
-    except requests.exceptions.Timeout:
+    except asyncio.TimeoutError:
         meta["error"] = "timeout"
         meta["hard_down"] = True
-        return 2, int((time.perf_counter() - start) * 1000), meta
+        return 2, _elapsed_ms(start_ns), meta
 
-    except requests.exceptions.RequestException as exc:
+    except aiohttp.ClientError as exc:
         meta["error"] = str(exc)
         meta["hard_down"] = True
-        return 2, int((time.perf_counter() - start) * 1000), meta
+        return 2, _elapsed_ms(start_ns), meta
 
     except Exception as exc:
         meta["error"] = str(exc)
         meta["hard_down"] = True
-        return 2, int((time.perf_counter() - start) * 1000), meta
+        return 2, _elapsed_ms(start_ns), meta
 
 
-def check_dns(name: str, timeout_sec: int, thresholds: Dict[str, Any]) -> Tuple[int, int, Dict[str, Any]]:
-    start = time.perf_counter()
+async def check_dns(name: str, timeout_sec: int, thresholds: Dict[str, Any]) -> Tuple[int, int, Dict[str, Any]]:
+    start_ns = time.monotonic_ns()
     meta: Dict[str, Any] = {}
 
     WARN_MS = _tint(thresholds, "dns_warn_ms", 1200)
 
     try:
-        resolver = dns.resolver.Resolver()
-        resolver.timeout = timeout_sec
-        resolver.lifetime = timeout_sec
-        answer = resolver.resolve(name, "A")
-        latency_ms = int((time.perf_counter() - start) * 1000)
-        meta["rrset"] = str(answer.rrset)
+        answer = await RESOLVER.query(name, "A")
+        latency_ms = _elapsed_ms(start_ns)
+        meta["rrset"] = ", ".join(r.host for r in answer)
 
         if latency_ms < WARN_MS:
             return 0, latency_ms, meta
@@ -445,20 +664,32 @@ def check_dns(name: str, timeout_sec: int, thresholds: Dict[str, Any]) -> Tuple[
     except Exception as exc:
         meta["error"] = str(exc)
         meta["hard_down"] = True
-        return 2, int((time.perf_counter() - start) * 1000), meta
+        return 2, _elapsed_ms(start_ns), meta
 
 
-def check_tcp(host: str, port: int, timeout_sec: int, thresholds: Dict[str, Any]) -> Tuple[int, int, Dict[str, Any]]:
-    start = time.perf_counter()
+async def check_tcp(host: str, port: int, timeout_sec: int, thresholds: Dict[str, Any]) -> Tuple[int, int, Dict[str, Any]]:
+    start_ns = time.monotonic_ns()
     meta: Dict[str, Any] = {}
 
     WARN_MS = _tint(thresholds, "tcp_warn_ms", 1500)
     VERY_SLOW_MS = _tint(thresholds, "tcp_very_slow_ms", 4000)
 
     try:
-        with socket.create_connection((host, port), timeout=timeout_sec):
+        ip = await resolve_cached(host)
+        # Les connect() d'un cycle sont tous en vol simultanément : la
+        # boucle d'événements les multiplexe sur epoll/kqueue, un seul
+        # thread suffit quel que soit le nombre de cibles tcp/ssl_cert.
+        _reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(ip, port), timeout=timeout_sec
+        )
+        latency_ms = _elapsed_ms(start_ns)
+        # Pour un check tcp, la latence EST le coût de connexion.
+        meta["connect_ms"] = latency_ms
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except Exception:
             pass
-        latency_ms = int((time.perf_counter() - start) * 1000)
 
         if latency_ms < WARN_MS:
             return 0, latency_ms, meta
@@ -470,55 +701,92 @@ def check_tcp(host: str, port: int, timeout_sec: int, thresholds: Dict[str, Any]
     except Exception as exc:
         meta["error"] = str(exc)
         meta["hard_down"] = True
-        return 2, int((time.perf_counter() - start) * 1000), meta
+        return 2, _elapsed_ms(start_ns), meta
+
+
+def _cert_policy(not_after: dt.datetime, latency_ms: int, meta: Dict[str, Any]) -> Tuple[int, int, Dict[str, Any]]:
+    days_left = (not_after - dt.datetime.now(dt.timezone.utc)).days
+    meta["not_after"] = not_after.isoformat()
+    meta["days_left"] = days_left
+
+    # Cert policy
+    if days_left >= 30:
+        return 0, latency_ms, meta
+    if days_left >= 7:
+        return 1, latency_ms, meta
+    return 2, latency_ms, meta  # cert critique (<7j)
 
 
-def check_ssl_cert(host: str, port: int, timeout_sec: int) -> Tuple[int, int, Dict[str, Any]]:
-    start = time.perf_counter()
+async def check_ssl_cert(host: str, port: int, timeout_sec: int) -> Tuple[int, int, Dict[str, Any]]:
+    start_ns = time.monotonic_ns()
     meta: Dict[str, Any] = {}
+
+    cached = CERT_CACHE.get((host, port))
+    if cached is not None and time.time() - cached[1] < CERT_CACHE_TTL_SEC:
+        # Échéance connue et fraîche : pas de handshake du tout.
+        meta["cert_source"] = "cache"
+        return _cert_policy(cached[0], _elapsed_ms(start_ns), meta)
+
     try:
-        ctx = ssl.create_default_context()
-        with socket.create_connection((host, port), timeout=timeout_sec) as sock:
-            with ctx.wrap_socket(sock, server_hostname=host) as ssock:
-                cert = ssock.getpeercert()
-
-        not_after = dt.datetime.strptime(cert["notAfter"], "%b %d %H:%M:%S %Y %Z")
-        days_left = (not_after - dt.datetime.utcnow()).days
-        meta["not_after"] = not_after.isoformat()
-        meta["days_left"] = days_left
-        latency_ms = int((time.perf_counter() - start) * 1000)
-
-        # Cert policy
-        if days_left >= 30:
-            return 0, latency_ms, meta
-        if days_left >= 7:
-            return 1, latency_ms, meta
-        return 2, latency_ms, meta  # cert critique (<7j)
+        ip = await resolve_cached(host)
+        _reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(ip, port, ssl=_SSL_CTX, server_hostname=host),
+            timeout=timeout_sec,
+        )
+        cert = writer.get_extra_info("peercert") or {}
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except Exception:
+            pass
+
+        not_after = dt.datetime.strptime(cert["notAfter"], "%b %d %H:%M:%S %Y %Z").replace(
+            tzinfo=dt.timezone.utc
+        )
+        CERT_CACHE[(host, port)] = (not_after, time.time())
+        return _cert_policy(not_after, _elapsed_ms(start_ns), meta)
 
     except Exception as exc:
+        # Invalidation : un échec force un vrai handshake au cycle suivant.
+        CERT_CACHE.pop((host, port), None)
         meta["error"] = str(exc)
         meta["hard_down"] = True
-        return 2, int((time.perf_counter() - start) * 1000), meta
+        return 2, _elapsed_ms(start_ns), meta
 
 
-def check_json_api(url: str, timeout_sec: int, expect_key: Optional[str], thresholds: Dict[str, Any]) -> Tuple[int, int, Dict[str, Any]]:
-    start = time.perf_counter()
+async def check_json_api(url: str, timeout_sec: int, expect_key: Optional[str], thresholds: Dict[str, Any]) -> Tuple[int, int, Dict[str, Any]]:
+    start_ns = time.monotonic_ns()
     meta: Dict[str, Any] = {}
 
     WARN_MS = _tint(thresholds, "json_warn_ms", 8000)
     VERY_SLOW_MS = _tint(thresholds, "json_very_slow_ms", 20000)
 
     try:
-        resp = requests.get(url, timeout=timeout_sec, headers={"User-Agent": "GNM-Collector/1.0"})
-        latency_ms = int((time.perf_counter() - start) * 1000)
-        meta["http_status"] = resp.status_code
-
-        if resp.status_code != 200:
-            meta["reason"] = f"http_{resp.status_code}"
+        trace: Dict[str, Any] = {}
+        async with SESSION.get(
+            url,
+            timeout=aiohttp.ClientTimeout(total=timeout_sec),
+            trace_request_ctx=trace,
+        ) as resp:
+            body = await resp.read()
+            status_code = resp.status
+        latency_ms = _elapsed_ms(start_ns)
+        meta["http_status"] = status_code
+
+        # Même découpage handshake / réponse que check_http.
+        connect_ms = int(trace.get("connect_ms", 0))
+        response_ms = max(0, latency_ms - connect_ms)
+        meta["total_ms"] = latency_ms
+        meta["response_ms"] = response_ms
+        if connect_ms:
+            meta["connect_ms"] = connect_ms
+
+        if status_code != 200:
+            meta["reason"] = f"http_{status_code}"
             return 1, latency_ms, meta
 
         try:
-            data = resp.json()
+            data = json.loads(body)
         except ValueError:
             meta["error"] = "json_decode_failed"
             return 1, latency_ms, meta
@@ -529,70 +797,91 @@ def check_json_api(url: str, timeout_sec: int, expect_key: Optional[str], thresh
                 meta["error"] = f"missing_key:{expect_key}"
                 return 1, latency_ms, meta
 
-        if latency_ms < WARN_MS:
+        if response_ms < WARN_MS:
             return 0, latency_ms, meta
 
         meta["reason"] = "slow_json_api"
-        meta["slow_level"] = "very" if latency_ms >= VERY_SLOW_MS else "mild"
+        meta["slow_level"] = "very" if response_ms >= VERY_SLOW_MS else "mild"
         return 1, latency_ms, meta
 
-    except requests.exceptions.Timeout:
+    except asyncio.TimeoutError:
         meta["error"] = "timeout"
         meta["hard_down"] = True
-        return 2, int((time.perf_counter() - start) * 1000), meta
+        return 2, _elapsed_ms(start_ns), meta
 
-    except requests.exceptions.RequestException as exc:
+    except aiohttp.ClientError as exc:
         meta["error"] = str(exc)
         meta["hard_down"] = True
-        return 2, int((time.perf_counter() - start) * 1000), meta
+        return 2, _elapsed_ms(start_ns), meta
 
     except Exception as exc:
         meta["error"] = str(exc)
         meta["hard_down"] = True
-        return 2, int((time.perf_counter() - start) * 1000), meta
+        return 2, _elapsed_ms(start_ns), meta
 
 
 # --------------------------------------------------------------------------- #
 # Dispatcher générique
 # --------------------------------------------------------------------------- #
 
-def run_check(ttype: str, t: Dict[str, Any], timeouts: Dict[str, Any], thresholds: Dict[str, Any]) -> Tuple[int, int, Dict[str, Any]]:
-    if ttype == "ping":
-        if "host" not in t or not t["host"]:
-            return 2, 0, {"error": "missing_field:host", "hard_down": True}
-        return check_ping(t["host"], timeouts["ping_timeout_sec"], thresholds)
-
-    if ttype == "http":
-        if "url" not in t or not t["url"]:
-            return 2, 0, {"error": "missing_field:url", "hard_down": True}
-        return check_http(t["url"], timeouts["http_timeout_sec"], thresholds)
-
-    if ttype == "dns":
-        if "host" not in t or not t["host"]:
-            return 2, 0, {"error": "missing_field:host", "hard_down": True}
-        return check_dns(t["host"], timeouts["dns_timeout_sec"], thresholds)
-
-    if ttype == "tcp":
-        if "host" not in t or "port" not in t or not t["host"] or t["port"] is None:
-            return 2, 0, {"error": "missing_field:host|port", "hard_down": True}
-        return check_tcp(t["host"], int(t["port"]), timeouts["tcp_timeout_sec"], thresholds)
-
-    if ttype == "ssl_cert":
-        if "host" not in t or "port" not in t or not t["host"] or t["port"] is None:
-            return 2, 0, {"error": "missing_field:host|port", "hard_down": True}
-        return check_ssl_cert(t["host"], int(t["port"]), timeouts["tcp_timeout_sec"])
-
-    if ttype == "json_api":
-        if "url" not in t or not t["url"]:
-            return 2, 0, {"error": "missing_field:url", "hard_down": True}
-        return check_json_api(
-            t["url"],
-            timeouts["http_timeout_sec"],
-            t.get("expect_key"),
-            thresholds,
-        )
+async def _dispatch_ping(t: Dict[str, Any], timeouts: Dict[str, Any], thresholds: Dict[str, Any]) -> Tuple[int, int, Dict[str, Any]]:
+    if not t.get("host"):
+        return 2, 0, {"error": "missing_field:host", "hard_down": True}
+    return await check_ping(t["host"], timeouts["ping_timeout_sec"], thresholds)
+
+
+async def _dispatch_http(t: Dict[str, Any], timeouts: Dict[str, Any], thresholds: Dict[str, Any]) -> Tuple[int, int, Dict[str, Any]]:
+    if not t.get("url"):
+        return 2, 0, {"error": "missing_field:url", "hard_down": True}
+    return await check_http(t["url"], timeouts["http_timeout_sec"], thresholds)
+
 
-    return 2, 0, {"error": f"unknown_type:{ttype}", "hard_down": True}
+async def _dispatch_dns(t: Dict[str, Any], timeouts: Dict[str, Any], thresholds: Dict[str, Any]) -> Tuple[int, int, Dict[str, Any]]:
+    if not t.get("host"):
+        return 2, 0, {"error": "missing_field:host", "hard_down": True}
+    return await check_dns(t["host"], timeouts["dns_timeout_sec"], thresholds)
+
+
+async def _dispatch_tcp(t: Dict[str, Any], timeouts: Dict[str, Any], thresholds: Dict[str, Any]) -> Tuple[int, int, Dict[str, Any]]:
+    if not t.get("host") or t.get("port") is None:
+        return 2, 0, {"error": "missing_field:host|port", "hard_down": True}
+    return await check_tcp(t["host"], int(t["port"]), timeouts["tcp_timeout_sec"], thresholds)
+
+
+async def _dispatch_ssl_cert(t: Dict[str, Any], timeouts: Dict[str, Any], thresholds: Dict[str, Any]) -> Tuple[int, int, Dict[str, Any]]:
+    if not t.get("host") or t.get("port") is None:
+        return 2, 0, {"error": "missing_field:host|port", "hard_down": True}
+    return await check_ssl_cert(t["host"], int(t["port"]), timeouts["tcp_timeout_sec"])
+
+
+async def _dispatch_json_api(t: Dict[str, Any], timeouts: Dict[str, Any], thresholds: Dict[str, Any]) -> Tuple[int, int, Dict[str, Any]]:
+    if not t.get("url"):
+        return 2, 0, {"error": "missing_field:url", "hard_down": True}
+    return await check_json_api(
+        t["url"],
+        timeouts["http_timeout_sec"],
+        t.get("expect_key"),
+        thresholds,
+    )
+
+
+# Table de dispatch construite une fois : lookup O(1) sur le chemin chaud,
+# et ajouter un type de check = une entrée ici + son handler.
+CHECK_HANDLERS = {
+    "ping": _dispatch_ping,
+    "http": _dispatch_http,
+    "dns": _dispatch_dns,
+    "tcp": _dispatch_tcp,
+    "ssl_cert": _dispatch_ssl_cert,
+    "json_api": _dispatch_json_api,
+}
+
+
+async def run_check(ttype: str, t: Dict[str, Any], timeouts: Dict[str, Any], thresholds: Dict[str, Any]) -> Tuple[int, int, Dict[str, Any]]:
+    handler = CHECK_HANDLERS.get(ttype)
+    if handler is None:
+        return 2, 0, {"error": f"unknown_type:{ttype}", "hard_down": True}
+    return await handler(t, timeouts, thresholds)
 
 
 # --------------------------------------------------------------------------- #
@@ -636,15 +925,19 @@ def build_check_payload(service: Dict[str, Any], host: Optional[Dict[str, Any]])
 # Exécution d'un service
 # --------------------------------------------------------------------------- #
 
-def run_one_service(
-    service: Dict[str, Any],
-    hosts: Dict[str, Dict[str, Any]],
-    timeouts: Dict[str, Any],
-    thresholds: Dict[str, Any],
-    region_fallback: str,
-    probe: Dict[str, Any],
-) -> Optional[Dict[str, Any]]:
+@dataclass(slots=True)
+class ServiceJob:
+    """Service validé + payload de check précalculés (une fois par reload)."""
+    service_id: str
+    host_id: str
+    ttype: str
+    payload: Dict[str, Any]
+    addr: Optional[str]
+    project_id: Optional[int]
+
 
+def build_job(service: Dict[str, Any], hosts: Dict[str, Dict[str, Any]]) -> Optional[ServiceJob]:
+    """Valide un service et construit son ServiceJob (None si invalide)."""
     service_id = service.get("service_id")
     if not service_id:
         log_error("missing_field:service_id")
@@ -672,44 +965,91 @@ def run_one_service(
         log_error(f"service_id={service_id} host_id={host_id} missing_field:host.address")
         return None
 
-    ttype, t_payload = build_check_payload(service, host)
-    status, latency_ms, meta = run_check(ttype, t_payload, timeouts, thresholds)
+    ttype, payload = build_check_payload(service, host)
+    return ServiceJob(
+        service_id=service_id,
+        host_id=host_id,
+        ttype=ttype,
+        payload=payload,
+        addr=addr,
+        project_id=service.get("project_id"),
+    )
+
+
+# Jobs précalculés, clé (mtime services.json, mtime hosts.json) : la
+# validation + urlparse + construction de payload ne se refont qu'au
+# changement de fichier, pas à chaque cycle.
+_jobs_cache: Optional[Tuple[Tuple[int, int], List[ServiceJob]]] = None
+
+
+def load_jobs() -> List[ServiceJob]:
+    global _jobs_cache
+    key = (SERVICES_PATH.stat().st_mtime_ns, HOSTS_PATH.stat().st_mtime_ns)
+    if _jobs_cache is not None and _jobs_cache[0] == key:
+        return _jobs_cache[1]
+
+    hosts = load_hosts()
+    services = load_services()
+    jobs = [j for j in (build_job(s, hosts) for s in services) if j is not None]
+    _jobs_cache = (key, jobs)
 
-    meta = meta or {}
-    meta.setdefault("host_id", host_id)
-    meta.setdefault("service_id", service_id)
-    meta.setdefault("host_address", addr or host_id)
+    # Purge des streaks de services disparus : évite la croissance
+    # non bornée du dict après reconfigurations successives.
+    active_ids = {j.service_id for j in jobs}
+    for stale in [k for k in STREAKS if k not in active_ids]:
+        del STREAKS[stale]
 
-    # Enrich probe info
-    probe_region = probe.get("probe_region") or region_fallback
-    meta.setdefault("probe_region", probe_region)
-    meta.setdefault("probe_country", probe.get("probe_country"))
-    meta.setdefault("probe_city", probe.get("probe_city"))
-    meta.setdefault("probe_public_ip", probe.get("probe_public_ip"))
-    meta.setdefault("probe_source", probe.get("probe_source"))
+    return jobs
+
+
+async def run_job(
+    job: ServiceJob,
+    timeouts: Dict[str, Any],
+    thresholds: Dict[str, Any],
+    probe_defaults: Dict[str, Any],
+) -> Dict[str, Any]:
+
+    service_id = job.service_id
+    host_id = job.host_id
+    ttype = job.ttype
+    addr = job.addr
+
+    status, latency_ms, meta = await run_check(ttype, job.payload, timeouts, thresholds)
+
+    # Enrichissement en une seule construction de dict : les valeurs du
+    # check (à droite) priment sur les défauts sonde précalculés.
+    meta = {
+        **probe_defaults,
+        "host_id": host_id,
+        "service_id": service_id,
+        "host_address": addr or host_id,
+        **(meta or {}),
+    }
 
     # 2-strikes : hard down doit être confirmé 2 fois
     hard_down = bool(meta.get("hard_down"))
-    key = service_id  # streak par service
+    streak = STREAKS.setdefault(service_id, [0, 0])  # [fail, ok]
 
     if hard_down:
-        FAIL_STREAK[key] = FAIL_STREAK.get(key, 0) + 1
-        OK_STREAK[key] = 0
+        streak[0] += 1
+        streak[1] = 0
 
-        if FAIL_STREAK[key] < 2:
+        if streak[0] < 2:
             meta["softened"] = "first_hard_down"
             status = 1
     else:
-        OK_STREAK[key] = OK_STREAK.get(key, 0) + 1
-        FAIL_STREAK[key] = 0
+        streak[1] += 1
+        streak[0] = 0
 
     # La "region" en DB = point de vue réel (sonde)
-    region = probe_region
+    region = probe_defaults["probe_region"]
 
     return {
-        "ts": dt.datetime.utcnow(),
+        # tz-aware UTC : PyMySQL écrit l'heure murale, la session DB est
+        # déjà forcée en +00:00 (init_command).
+        "ts": dt.datetime.now(dt.timezone.utc),
         "region": region,
-        "project_id": service.get("project_id"),
+        "project_id": job.project_id,
         "target_id": service_id,
         "host_id": host_id,
         "type": ttype,
@@ -723,6 +1063,82 @@ def run_one_service(
 # Boucle principale
 # --------------------------------------------------------------------------- #
 
+async def main_loop(
+    conn: pymysql.Connection,
+    timeouts: Dict[str, Any],
+    thresholds: Dict[str, Any],
+    probe_defaults: Dict[str, Any],
+    interval_sec: int,
+    once: bool,
+    http_pool_size: int,
+) -> None:
+    """
+    Boucle de cycles dans une seule boucle d'événements : la session
+    aiohttp (et son pool keep-alive) survit d'un cycle à l'autre.
+    """
+    global SESSION, RESOLVER
+    SESSION = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=http_pool_size, ttl_dns_cache=300),
+        headers=_UA_HEADERS,
+        trace_configs=[_make_trace_config()],
+    )
+    RESOLVER = aiodns.DNSResolver(timeout=timeouts["dns_timeout_sec"], tries=1)
+    try:
+        while True:
+            cycle_start = time.time()
+            elapsed = 0.0
+
+            jobs = load_jobs()
+            results: List[Dict[str, Any]] = []
+
+            # gather préserve l'ordre de soumission : pas de ré-association
+            # résultat -> service nécessaire côté agrégation.
+            for res in await asyncio.gather(
+                *(run_job(job, timeouts, thresholds, probe_defaults) for job in jobs),
+                return_exceptions=True,
+            ):
+                if isinstance(res, BaseException):
+                    log_error("worker_failed", res)
+                elif res:
+                    results.append(res)
+
+            # Un cycle = une transaction (ping d'abord pour survivre aux
+            # timeouts d'inactivité côté serveur).
+            conn.ping(reconnect=True)
+            try:
+                conn.begin()
+                insert_measurements(conn, results)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+            for res in results:
+                log_info(
+                    f"service={res['target_id']} host_id={res['host_id']} type={res['type']} "
+                    f"status={res['status']} latency={res['latency_ms']}ms region={res['region']}"
+                )
+
+            elapsed = time.time() - cycle_start
+            ok = sum(1 for r in results if r["status"] == 0)
+            warn = sum(1 for r in results if r["status"] == 1)
+            crit = sum(1 for r in results if r["status"] == 2)
+
+            log_info(
+                f"cycle_summary services={len(results)} ok={ok} warn={warn} crit={crit} "
+                f"cycle_duration={elapsed:.3f}s"
+            )
+
+            if once:
+                break
+
+            sleep_time = max(1, interval_sec - elapsed) if elapsed > 0 else interval_sec
+            await asyncio.sleep(sleep_time)
+    finally:
+        await SESSION.close()
+        SESSION = None
+
+
 def main() -> None:
     cfg = load_config()
     db_cfg = cfg["db"]
@@ -738,10 +1154,15 @@ def main() -> None:
 
     thresholds = cfg["collector"].get("thresholds", {})
 
-    max_workers = cfg["collector"]["max_workers"]
+    # Taille du pool de connexions HTTP keep-alive : dimensionné depuis
+    # max_workers (l'ancienne limite de threads) faute de réglage dédié.
+    max_workers = cfg["collector"].get("max_workers", 20)
+    http_pool_size = int(cfg["collector"].get("http_pool_size", max_workers * 2))
+
     once = len(sys.argv) > 1 and sys.argv[1] == "once"
 
-    hosts = load_hosts()
+    # Fail-fast au démarrage si hosts.json est absent / invalide.
+    load_hosts()
 
     # Probe dynamic region discovery (au démarrage; cache TTL 24h)
     probe = discover_probe_identity(cfg_region_fallback=region_fallback, timeout_sec=4)
@@ -750,56 +1171,28 @@ def main() -> None:
         f"city={probe.get('probe_city')} ip={probe.get('probe_public_ip')} source={probe.get('probe_source')}"
     )
 
-    while True:
-        cycle_start = time.time()
-        elapsed = 0.0
-
-        conn = get_db_conn(db_cfg)
-
-        try:
-            services = load_services()
-            results: List[Dict[str, Any]] = []
-
-            workers = min(max_workers, len(services) or 1)
-
-            with ThreadPoolExecutor(max_workers=workers) as executor:
-                futures = [
-                    executor.submit(run_one_service, s, hosts, timeouts, thresholds, region_fallback, probe)
-                    for s in services
-                ]
-                for fut in as_completed(futures):
-                    try:
-                        res = fut.result()
-                        if res:
-                            results.append(res)
-                    except Exception as e:
-                        log_error("worker_failed", e)
-
-            for res in results:
-                insert_measurement(conn, **res)
-                log_info(
-                    f"service={res['target_id']} host_id={res['host_id']} type={res['type']} "
-                    f"status={res['status']} latency={res['latency_ms']}ms region={res['region']}"
-                )
-
-            elapsed = time.time() - cycle_start
-            ok = sum(1 for r in results if r["status"] == 0)
-            warn = sum(1 for r in results if r["status"] == 1)
-            crit = sum(1 for r in results if r["status"] == 2)
-
-            log_info(
-                f"cycle_summary services={len(results)} ok={ok} warn={warn} crit={crit} "
-                f"cycle_duration={elapsed:.3f}s"
-            )
-
-        finally:
-            conn.close()
+    # Défauts meta par sonde, figés pour toute la durée du process :
+    # mergés en une fois dans run_job au lieu de cinq setdefault par check.
+    probe_defaults = {
+        "probe_region": probe.get("probe_region") or region_fallback,
+        "probe_country": probe.get("probe_country"),
+        "probe_city": probe.get("probe_city"),
+        "probe_public_ip": probe.get("probe_public_ip"),
+        "probe_source": probe.get("probe_source"),
+    }
 
-        if once:
-            break
+    # Connexion persistante entre les cycles : on évite le handshake
+    # TCP + auth MySQL à chaque itération. ping(reconnect=True) avant
+    # chaque insert gère les coupures / timeouts d'inactivité.
+    conn = get_db_conn(db_cfg)
+    atexit.register(conn.close)
 
-        sleep_time = max(1, interval_sec - elapsed) if elapsed > 0 else interval_sec
-        time.sleep(sleep_time)
+    asyncio.run(
+        main_loop(
+            conn, timeouts, thresholds, probe_defaults,
+            interval_sec, once, http_pool_size,
+        )
+    )
 
 
 if __name__ == "__main__":
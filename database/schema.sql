@@ -27,9 +27,65 @@ CREATE TABLE IF NOT EXISTS measurements (
     INDEX idx_ts (ts),
     INDEX idx_project (project_id),
     INDEX idx_target (target_id),
-    INDEX idx_region (region)
+    INDEX idx_region (region),
+    INDEX idx_target_ts (target_id, ts DESC)
 
 ) ENGINE=InnoDB
   DEFAULT CHARSET=utf8mb4
   COLLATE=utf8mb4_unicode_ci;
 
+-- Latest measurement per (target, region), maintained by trigger.
+-- Reads become a PK lookup instead of a scan over measurements,
+-- independent of retention depth. Keyed per region so that with
+-- multiple collectors sharing one database (see
+-- docs/collector-architecture.md §14), one region's write does not
+-- hide another region's latest row.
+
+CREATE TABLE IF NOT EXISTS measurements_last (
+    target_id VARCHAR(128) NOT NULL,
+
+    ts DATETIME NOT NULL,
+
+    region VARCHAR(32) NOT NULL,
+
+    PRIMARY KEY (target_id, region),
+
+    project_id INT NULL,
+
+    host_id VARCHAR(128) NULL,
+
+    type VARCHAR(32) NOT NULL,
+
+    status TINYINT NOT NULL COMMENT '0=OK, 1=WARN, 2=CRIT',
+
+    latency_ms INT NOT NULL,
+
+    meta_json JSON NULL
+
+) ENGINE=InnoDB
+  DEFAULT CHARSET=utf8mb4
+  COLLATE=utf8mb4_unicode_ci;
+
+DELIMITER $$
+
+CREATE TRIGGER IF NOT EXISTS trg_measurements_last
+AFTER INSERT ON measurements
+FOR EACH ROW
+BEGIN
+    INSERT INTO measurements_last
+        (target_id, ts, region, project_id, host_id, type, status, latency_ms, meta_json)
+    VALUES
+        (NEW.target_id, NEW.ts, NEW.region, NEW.project_id, NEW.host_id,
+         NEW.type, NEW.status, NEW.latency_ms, NEW.meta_json)
+    ON DUPLICATE KEY UPDATE
+        project_id = IF(NEW.ts >= ts, NEW.project_id, project_id),
+        host_id = IF(NEW.ts >= ts, NEW.host_id, host_id),
+        type = IF(NEW.ts >= ts, NEW.type, type),
+        status = IF(NEW.ts >= ts, NEW.status, status),
+        latency_ms = IF(NEW.ts >= ts, NEW.latency_ms, latency_ms),
+        meta_json = IF(NEW.ts >= ts, NEW.meta_json, meta_json),
+        ts = IF(NEW.ts >= ts, NEW.ts, ts);
+END$$
+
+DELIMITER ;
+